@@ -1,11 +1,11 @@
 """Base classes for implementing extensions."""
 
-import locale
 import logging
 import os
-from email.parser import FeedParser
+import pathlib
+from email import message_from_string
+from importlib import import_module
 
-import pkg_resources
 from django.conf import settings
 from django.core.exceptions import ImproperlyConfigured
 from django.templatetags.static import static
@@ -18,6 +18,14 @@ from djblets.extensions.settings import ExtensionSettings
 from djblets.util.decorators import cached_property
 
 
+try:
+    # Python >= 3.9
+    from importlib.resources import files as _get_resource_files
+except ImportError:
+    # Python 3.7 and 3.8. We'll fall back on pkg_resources.
+    _get_resource_files = None
+
+
 logger = logging.getLogger(__name__)
 
 
@@ -63,6 +71,11 @@ class JSExtension(object):
         """
         self.extension = extension
 
+        if self.apply_to is None:
+            self._apply_to_set = None
+        else:
+            self._apply_to_set = frozenset(self.apply_to)
+
     def applies_to(self, url_name):
         """Return whether this extension applies to the given URL name.
 
@@ -75,7 +88,7 @@ class JSExtension(object):
             ``True`` if this JavaScript extension should load on the page
             with the given URL name. ``False`` if it should not load.
         """
-        return self.apply_to is None or url_name in self.apply_to
+        return self._apply_to_set is None or url_name in self._apply_to_set
 
     def get_model_data(self, request, **kwargs):
         """Return model data for the Extension model instance in JavaScript.
@@ -131,12 +144,6 @@ class Extension(object):
         hooks (set of djblets.extensions.hooks.ExtensionHook):
             The hooks currently registered and enabled for the extension.
 
-        middleware_classes (list of callable):
-            The list of new-style (Django 1.10+) middleware classses.
-
-            Version Added:
-                2.2.4
-
         settings (djblets.extensions.settings.ExtensionSettings):
             The settings for the extension.
     """
@@ -254,6 +261,27 @@ class Extension(object):
     #: Each entry in the list is a :py:class:`JSExtension` subclass to load.
     js_extensions = []
 
+    #: The imported middleware classes, shared by all instances of a class.
+    #:
+    #: This is only set once all middleware has been imported successfully,
+    #: so a failed import will be attempted again (and reported again) the
+    #: next time the extension is constructed.
+    _resolved_middleware = None
+
+    def __init_subclass__(cls, **kwargs):
+        """Initialize a subclass of Extension.
+
+        This ensures each subclass resolves and caches its own list of
+        middleware, rather than inheriting its parent's.
+
+        Args:
+            **kwargs (dict):
+                Keyword arguments to pass to the parent.
+        """
+        super().__init_subclass__(**kwargs)
+
+        cls._resolved_middleware = None
+
     def __init__(self, extension_manager):
         """Initialize the extension.
 
@@ -269,10 +297,14 @@ class Extension(object):
         self.settings = ExtensionSettings(self)
         self.admin_site = None
 
-        self.middleware_classes = []
+        # These are used to build static media URLs and bundle IDs, which
+        # may be requested many times per page render.
+        self._static_url_prefix = 'ext/%s/' % self.id
+        self._bundle_id_prefix = '%s-' % self.id
 
-        for middleware_path in self.middleware:
-            self.middleware_classes.append(import_string(middleware_path))
+        # Resolve the middleware before any hooks are registered, so that
+        # import errors prevent the extension from initializing.
+        self.middleware_classes
 
         self.initialize()
 
@@ -314,7 +346,7 @@ class Extension(object):
             unicode:
             The resulting static media URL.
         """
-        return static('ext/%s/%s' % (self.id, path))
+        return static(self._static_url_prefix + path)
 
     def get_bundle_id(self, name):
         """Return the ID for a CSS or JavaScript bundle.
@@ -330,7 +362,43 @@ class Extension(object):
             unicode:
             The ID of the bundle corresponding to the name.
         """
-        return '%s-%s' % (self.id, name)
+        return self._bundle_id_prefix + name
+
+    @cached_property
+    def middleware_classes(self):
+        """The list of new-style (Django 1.10+) middleware classes.
+
+        The middleware listed in :py:attr:`middleware` will be imported when
+        the extension is constructed, before :py:meth:`initialize` is called.
+        The result is shared by all instances of the extension class, unless
+        the instance sets its own :py:attr:`middleware`.
+
+        Version Added:
+            2.2.4
+
+        Version Changed:
+            4.0:
+            The imported middleware is now shared by all instances of the
+            extension class.
+
+        Type:
+            list of callable
+        """
+        if 'middleware' in self.__dict__:
+            return [
+                import_string(middleware_path)
+                for middleware_path in self.middleware
+            ]
+
+        cls = type(self)
+
+        if cls._resolved_middleware is None:
+            cls._resolved_middleware = tuple(
+                import_string(middleware_path)
+                for middleware_path in cls.middleware
+            )
+
+        return list(cls._resolved_middleware)
 
     @cached_property
     def admin_urlconf(self):
@@ -354,8 +422,6 @@ class ExtensionInfo(object):
     in the Python package for the extension.
     """
 
-    encodings = ['utf-8', locale.getpreferredencoding(False), 'latin1']
-
     @classmethod
     def create_from_entrypoint(cls, entrypoint, ext_class):
         """Create a new ExtensionInfo from a Python EntryPoint.
@@ -366,8 +432,14 @@ class ExtensionInfo(object):
         It handles pulling out metadata from the older :file:`PKG-INFO` files
         and the newer :file:`METADATA` files.
 
+        Version Changed:
+            4.0:
+            This now accepts :py:class:`importlib.metadata.EntryPoint`
+            instances, in addition to :py:class:`pkg_resources.EntryPoint`.
+
         Args:
-            entrypoint (pkg_resources.EntryPoint):
+            entrypoint (importlib.metadata.EntryPoint or
+                        pkg_resources.EntryPoint):
                 The EntryPoint pointing to the extension class.
 
             ext_class (type):
@@ -392,7 +464,8 @@ class ExtensionInfo(object):
         an entrypoint for use in ExtensionInfo.
 
         Args:
-            entrypoint (pkg_resources.EntryPoint):
+            entrypoint (importlib.metadata.EntryPoint or
+                        pkg_resources.EntryPoint):
                 The EntryPoint pointing to the extension class.
 
             extension_id (unicode):
@@ -404,49 +477,44 @@ class ExtensionInfo(object):
         """
         dist = entrypoint.dist
 
+        if not hasattr(dist, 'get_metadata'):
+            # This is an importlib.metadata distribution, which has already
+            # located and parsed the METADATA or PKG-INFO file for us.
+            pkg_info = dist.metadata
+
+            # Depending on the version of Python, a missing metadata file
+            # results in either None or an empty Message.
+            if not pkg_info:
+                logger.error('No METADATA or PKG-INFO found for the package '
+                             'containing the %s extension. Information on '
+                             'the extension may be missing.',
+                             extension_id)
+                return {}
+
+            return dict(pkg_info.items())
+
+        # Read the metadata as a single blob, so it can be parsed in one
+        # pass rather than fed through a parser line-by-line.
         try:
             # Wheel, or other modern package.
-            lines = list(dist.get_metadata_lines('METADATA'))
+            data = dist.get_metadata('METADATA')
         except IOError:
             try:
                 # Egg, or other legacy package.
-                lines = list(dist.get_metadata_lines('PKG-INFO'))
+                data = dist.get_metadata('PKG-INFO')
             except IOError:
-                lines = []
+                data = ''
                 logger.error('No METADATA or PKG-INFO found for the package '
                              'containing the %s extension. Information on '
                              'the extension may be missing.',
                              extension_id)
 
-        # pkg_resources on Python 3 will always give us back Unicode strings,
-        # but Python 2 may give us back either Unicode or byte strings.
-        if lines and isinstance(lines[0], bytes):
-            data = b'\n'.join(lines)
-
-            # Try to decode the PKG-INFO content. If no decoding method is
-            # successful then the PKG-INFO content will remain unchanged and
-            # processing will continue with the parsing.
-            for enc in cls.encodings:
-                try:
-                    data = data.decode(enc)
-                    break
-                except UnicodeDecodeError:
-                    continue
-            else:
-                logger.warning('Failed decoding PKG-INFO content for '
-                               'extension %s',
-                               entrypoint.name)
-        else:
-            data = '\n'.join(lines)
-
-        p = FeedParser()
-        p.feed(data)
-        pkg_info = p.close()
+        pkg_info = message_from_string(data)
 
         # Convert from a Message to a dictionary.
         return dict(pkg_info.items())
 
-    def __init__(self, ext_class, package_name, metadata={}):
+    def __init__(self, ext_class, package_name, metadata=None):
         """Instantiate the ExtensionInfo using metadata and an extension class.
 
         This will set information about the extension based on the metadata
@@ -482,13 +550,15 @@ class ExtensionInfo(object):
         # Set the base information from the extension and the package.
         self.package_name = package_name
         self.module_name = ext_class.__module__
-        self.app_name = '.'.join(ext_class.__module__.split('.')[:-1])
+        self.app_name = ext_class.__module__.rpartition('.')[0]
         self.is_configurable = ext_class.is_configurable
         self.has_admin_site = ext_class.has_admin_site
         self.installed_htdocs_path = \
             os.path.join(settings.MEDIA_ROOT, 'ext', self.package_name)
         self.installed_static_path = \
             os.path.join(settings.STATIC_ROOT, 'ext', ext_class.id)
+        self.installed_static_version_path = \
+            os.path.join(self.installed_static_path, '.version')
 
         # State set by ExtensionManager.
         self.enabled = False
@@ -497,7 +567,17 @@ class ExtensionInfo(object):
         self.apps_registered = False
         self.context_processors_registered = False
 
-        # Set information from the provided metadata.
+        # A cache of the installed static media version, along with the
+        # modification state of the version file it was read from.
+        self._static_version_cache = None
+
+        # Set information from the provided metadata. This is copied so the
+        # caller's dictionary isn't modified.
+        if metadata is None:
+            metadata = {}
+        else:
+            metadata = dict(metadata)
+
         if ext_class.metadata is not None:
             metadata.update(ext_class.metadata)
 
@@ -512,18 +592,6 @@ class ExtensionInfo(object):
         self.url = metadata.get('Home-page')
         self.author_url = metadata.get('Author-home-page', self.url)
 
-    @cached_property
-    def installed_static_version_path(self):
-        """The path to the static media version file.
-
-        This file records the version of the extension used when last
-        installing the static media files.
-
-        Type:
-            unicode
-        """
-        return os.path.join(self.installed_static_path, '.version')
-
     def has_resource(self, path):
         """Return whether an extension has a resource in its package.
 
@@ -538,7 +606,14 @@ class ExtensionInfo(object):
             bool:
             ``True`` if the resource exits. ``False`` if it does not.
         """
-        return pkg_resources.resource_exists(self.module_name, path)
+        if _get_resource_files is None:
+            import pkg_resources
+
+            return pkg_resources.resource_exists(self.module_name, path)
+
+        resource = self._get_resource(path)
+
+        return resource.is_file() or resource.is_dir()
 
     def extract_resource(self, path):
         """Return the filesystem path to an extracted resource.
@@ -559,10 +634,44 @@ class ExtensionInfo(object):
             The local filesystem path to the resource, or ``None`` if it
             could not be found.
         """
-        if self.has_resource(path):
-            return pkg_resources.resource_filename(self.module_name, path)
+        if not self.has_resource(path):
+            return None
+
+        if _get_resource_files is not None:
+            resource = self._get_resource(path)
+
+            if isinstance(resource, pathlib.Path):
+                return str(resource)
+
+        # Either this is an older version of Python, or the package isn't
+        # on the filesystem (such as a zipped egg). pkg_resources will
+        # extract it to a persistent cache directory for us.
+        import pkg_resources
+
+        return pkg_resources.resource_filename(self.module_name, path)
+
+    def _get_resource(self, path):
+        """Return a traversable resource within the extension's package.
+
+        Resources are looked up relative to the package containing the
+        extension's module, matching the behavior of :py:mod:`pkg_resources`.
+
+        Args:
+            path (unicode):
+                The ``/``-delimited path to the resource within the package.
+
+        Returns:
+            importlib.abc.Traversable:
+            The resource. This may not exist.
+        """
+        module = import_module(self.module_name)
+
+        if hasattr(module, '__path__'):
+            package_name = module.__name__
+        else:
+            package_name = module.__package__
 
-        return None
+        return _get_resource_files(package_name).joinpath(path)
 
     def write_installed_static_version(self):
         """Write the extension's current static media version to disk.
@@ -580,11 +689,12 @@ class ExtensionInfo(object):
         parent_path = os.path.dirname(version_path)
 
         try:
-            if not os.path.exists(parent_path):
-                os.makedirs(parent_path, 0o755)
+            os.makedirs(parent_path, 0o755, exist_ok=True)
 
             with open(version_path, 'w') as fp:
                 fp.write('%s\n' % self.version)
+
+            self._static_version_cache = None
         except Exception:
             raise InstallExtensionMediaError(
                 _('Unable to write the extension static media version '
@@ -597,16 +707,39 @@ class ExtensionInfo(object):
     def get_installed_static_version(self):
         """Return the extension's locally-written static media version.
 
+        The version is cached until the version file is modified.
+
         Returns:
             unicode:
             The extension version written to disk, or ``None`` if it didn't
             exist or couldn't be read.
         """
+        version_path = self.installed_static_version_path
+
         try:
-            with open(self.installed_static_version_path, 'r') as fp:
-                return fp.read().strip()
+            st = os.stat(version_path)
+        except OSError:
+            self._static_version_cache = None
+
+            return None
+
+        file_state = (st.st_mtime_ns, st.st_size)
+        cache = self._static_version_cache
+
+        if cache is not None and cache[0] == file_state:
+            return cache[1]
+
+        try:
+            with open(version_path, 'r') as fp:
+                version = fp.read().strip()
         except IOError:
+            self._static_version_cache = None
+
             return None
 
+        self._static_version_cache = (file_state, version)
+
+        return version
+
     def __str__(self):
         return '%s %s (enabled = %s)' % (self.name, self.version, self.enabled)
@@ -1,10 +1,13 @@
 """Unit tests for djblets.extensions.extension.Extension."""
 
 from django.core.exceptions import ImproperlyConfigured
+from django.templatetags.static import static
+from django.utils.module_loading import import_string
 from kgb import SpyAgency
 
-from djblets.extensions.extension import Extension
+from djblets.extensions.extension import Extension, JSExtension
 from djblets.extensions.hooks import ExtensionHook, ExtensionHookPoint
+from djblets.extensions.middleware import ExtensionsMiddleware
 from djblets.extensions.settings import ExtensionSettings
 from djblets.extensions.testing import ExtensionTestCaseMixin
 from djblets.testing.testcases import TestCase
@@ -82,3 +85,99 @@ class ExtensionTest(SpyAgency, ExtensionTestCaseMixin, TestCase):
             extension.admin_urlconf
         except ImproperlyConfigured:
             self.fail('Should have loaded admin_urls.py')
+
+    def test_middleware_classes(self):
+        """Testing Extension.middleware_classes"""
+        resolved_in_initialize = []
+
+        class TestExtension(Extension):
+            middleware = [
+                'djblets.extensions.middleware.ExtensionsMiddleware',
+            ]
+
+            def initialize(self):
+                resolved_in_initialize.append(
+                    'middleware_classes' in self.__dict__)
+
+        # Register the extension without enabling it, so that the manager
+        # doesn't construct it.
+        self.setup_extension(TestExtension, enable=False)
+        extension = TestExtension(extension_manager=self.extension_mgr)
+
+        # The middleware must be resolved before initialize() is called.
+        self.assertEqual(resolved_in_initialize, [True])
+        self.assertEqual(extension.middleware_classes, [ExtensionsMiddleware])
+
+    def test_middleware_classes_shared_by_class(self):
+        """Testing Extension.middleware_classes resolves middleware once per
+        class
+        """
+        class TestExtension(Extension):
+            middleware = [
+                'djblets.extensions.middleware.ExtensionsMiddleware',
+            ]
+
+        class TestSubExtension(TestExtension):
+            middleware = []
+
+        self.setup_extension(TestExtension, enable=False)
+        self.setup_extension(TestSubExtension, enable=False)
+
+        extension1 = TestExtension(extension_manager=self.extension_mgr)
+        self.assertEqual(extension1.middleware_classes, [ExtensionsMiddleware])
+
+        self.spy_on(import_string)
+
+        extension2 = TestExtension(extension_manager=self.extension_mgr)
+        self.assertEqual(extension2.middleware_classes, [ExtensionsMiddleware])
+        self.assertFalse(import_string.called)
+
+        sub_extension = TestSubExtension(extension_manager=self.extension_mgr)
+        self.assertEqual(sub_extension.middleware_classes, [])
+
+    def test_get_bundle_id(self):
+        """Testing Extension.get_bundle_id"""
+        class TestExtension(Extension):
+            pass
+
+        extension = self.setup_extension(TestExtension)
+
+        self.assertEqual(extension.get_bundle_id('default'),
+                         '%s-default' % extension.id)
+
+    def test_get_static_url(self):
+        """Testing Extension.get_static_url"""
+        class TestExtension(Extension):
+            pass
+
+        extension = self.setup_extension(TestExtension)
+
+        self.spy_on(static, call_fake=lambda path: '/static/%s' % path)
+
+        self.assertEqual(extension.get_static_url('css/test.css'),
+                         '/static/ext/%s/css/test.css' % extension.id)
+
+
+class JSExtensionTests(TestCase):
+    """Unit tests for djblets.extensions.extension.JSExtension."""
+
+    def test_applies_to_default(self):
+        """Testing JSExtension.applies_to defaults to all URLs"""
+        class TestJSExtension(JSExtension):
+            pass
+
+        js_extension = TestJSExtension(extension=None)
+
+        self.assertTrue(js_extension.applies_to('foo'))
+        self.assertTrue(js_extension.applies_to(None))
+
+    def test_applies_to_with_apply_to(self):
+        """Testing JSExtension.applies_to with apply_to"""
+        class TestJSExtension(JSExtension):
+            apply_to = ['foo', 'bar']
+
+        js_extension = TestJSExtension(extension=None)
+
+        self.assertTrue(js_extension.applies_to('foo'))
+        self.assertTrue(js_extension.applies_to('bar'))
+        self.assertFalse(js_extension.applies_to('baz'))
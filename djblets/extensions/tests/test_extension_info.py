@@ -1,6 +1,8 @@
 """Unit tests for djblets.extensions.extension.ExtensionInfo."""
 
 import os
+import shutil
+import tempfile
 
 from django.conf import settings
 
@@ -101,6 +103,214 @@ class ExtensionInfoTests(TestCase):
                                    extension_id=extension_id,
                                    metadata=expected_metadata)
 
+    def test_create_from_entrypoint_with_importlib_metadata(self):
+        """Testing ExtensionInfo.create_from_entrypoint with an
+        importlib.metadata entry point
+        """
+        from importlib.metadata import PathDistribution
+        from pathlib import Path
+
+        module_name = 'test_extension.dummy.submodule'
+        package_name = 'DummyExtension'
+        extension_id = '%s:DummyExtension' % module_name
+
+        class TestExtension(Extension):
+            __module__ = module_name
+            id = extension_id
+
+        metadata = {
+            'Author': 'Example Author',
+            'Author-email': 'author@example.com',
+            'Description': 'Test description',
+            'Home-page': 'http://example.com',
+            'License': 'Drivers',
+            'Metadata-Version': '2.1',
+            'Name': package_name,
+            'Summary': 'Test summary',
+            'Version': '1.0',
+        }
+
+        tempdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tempdir)
+
+        with open(os.path.join(tempdir, 'METADATA'), 'w') as fp:
+            fp.write(''.join(
+                '%s: %s\n' % (key, value)
+                for key, value in metadata.items()
+            ))
+
+        class _EntryPoint(object):
+            dist = PathDistribution(Path(tempdir))
+
+        extension_info = ExtensionInfo.create_from_entrypoint(_EntryPoint,
+                                                              TestExtension)
+
+        self._check_extension_info(extension_info=extension_info,
+                                   app_name='test_extension.dummy',
+                                   package_name=package_name,
+                                   extension_id=extension_id,
+                                   metadata=metadata)
+
+    def test_create_from_entrypoint_with_importlib_no_metadata(self):
+        """Testing ExtensionInfo.create_from_entrypoint with an
+        importlib.metadata entry point without a METADATA or PKG-INFO file
+        """
+        from importlib.metadata import PathDistribution
+        from pathlib import Path
+
+        module_name = 'test_extension.dummy.submodule'
+        extension_id = '%s:DummyExtension' % module_name
+
+        class TestExtension(Extension):
+            __module__ = module_name
+            id = extension_id
+
+        tempdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tempdir)
+
+        class _EntryPoint(object):
+            dist = PathDistribution(Path(tempdir))
+
+        with self.assertLogs() as logs:
+            extension_info = ExtensionInfo.create_from_entrypoint(
+                _EntryPoint, TestExtension)
+
+        self.assertEqual(
+            logs.records[0].getMessage(),
+            'No METADATA or PKG-INFO found for the package containing the '
+            '%s extension. Information on the extension may be missing.'
+            % extension_id)
+        self.assertEqual(extension_info.metadata, {})
+        self.assertEqual(extension_info.package_name, extension_id)
+
+    def test_init_does_not_modify_metadata(self):
+        """Testing ExtensionInfo.__init__ does not modify the provided
+        metadata
+        """
+        class TestExtension(Extension):
+            id = 'TestExtension'
+            metadata = {
+                'Name': 'OverrideName',
+            }
+
+        metadata = {
+            'Name': 'TestPackage',
+            'Version': '1.0',
+        }
+
+        extension_info = ExtensionInfo(ext_class=TestExtension,
+                                       package_name='TestPackage',
+                                       metadata=metadata)
+
+        self.assertEqual(extension_info.metadata, {
+            'Name': 'OverrideName',
+            'Version': '1.0',
+        })
+        self.assertEqual(metadata, {
+            'Name': 'TestPackage',
+            'Version': '1.0',
+        })
+
+        # The default metadata must not be shared between instances.
+        extension_info = ExtensionInfo(ext_class=TestExtension,
+                                       package_name='TestPackage')
+        self.assertEqual(extension_info.metadata, {
+            'Name': 'OverrideName',
+        })
+
+        class TestExtension2(Extension):
+            id = 'TestExtension2'
+
+        extension_info = ExtensionInfo(ext_class=TestExtension2,
+                                       package_name='TestPackage')
+        self.assertEqual(extension_info.metadata, {})
+
+    def test_has_resource(self):
+        """Testing ExtensionInfo.has_resource"""
+        class TestExtension(Extension):
+            id = 'TestExtension'
+
+        extension_info = ExtensionInfo(ext_class=TestExtension,
+                                       package_name='TestPackage')
+
+        self.assertTrue(extension_info.has_resource('static'))
+        self.assertTrue(extension_info.has_resource('static/css'))
+        self.assertTrue(extension_info.has_resource('__init__.py'))
+        self.assertFalse(extension_info.has_resource('htdocs'))
+
+    def test_extract_resource(self):
+        """Testing ExtensionInfo.extract_resource"""
+        class TestExtension(Extension):
+            id = 'TestExtension'
+
+        extension_info = ExtensionInfo(ext_class=TestExtension,
+                                       package_name='TestPackage')
+
+        self.assertEqual(extension_info.extract_resource('static'),
+                         os.path.join(os.path.dirname(__file__), 'static'))
+        self.assertIsNone(extension_info.extract_resource('htdocs'))
+
+    def test_get_installed_static_version(self):
+        """Testing ExtensionInfo.get_installed_static_version"""
+        class TestExtension(Extension):
+            id = 'TestExtension'
+
+        extension_info = ExtensionInfo(ext_class=TestExtension,
+                                       package_name='TestPackage',
+                                       metadata={
+                                           'Version': '1.0',
+                                       })
+        self.addCleanup(shutil.rmtree, extension_info.installed_static_path,
+                        ignore_errors=True)
+
+        self.assertIsNone(extension_info.get_installed_static_version())
+
+        extension_info.write_installed_static_version()
+        self.assertEqual(extension_info.get_installed_static_version(), '1.0')
+
+        # Change the file contents while preserving the modification time
+        # and size. The cached version should still be returned, since the
+        # file won't be read again.
+        version_path = extension_info.installed_static_version_path
+        st = os.stat(version_path)
+
+        with open(version_path, 'w') as fp:
+            fp.write('2.0\n')
+
+        os.utime(version_path, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+        self.assertEqual(extension_info.get_installed_static_version(), '1.0')
+
+    def test_get_installed_static_version_after_modified(self):
+        """Testing ExtensionInfo.get_installed_static_version after the
+        version file is modified
+        """
+        class TestExtension(Extension):
+            id = 'TestExtension'
+
+        extension_info = ExtensionInfo(ext_class=TestExtension,
+                                       package_name='TestPackage',
+                                       metadata={
+                                           'Version': '1.0',
+                                       })
+        self.addCleanup(shutil.rmtree, extension_info.installed_static_path,
+                        ignore_errors=True)
+
+        extension_info.write_installed_static_version()
+        self.assertEqual(extension_info.get_installed_static_version(), '1.0')
+
+        # Simulate another process writing a new version.
+        version_path = extension_info.installed_static_version_path
+
+        with open(version_path, 'w') as fp:
+            fp.write('1.0.1\n')
+
+        self.assertEqual(extension_info.get_installed_static_version(),
+                         '1.0.1')
+
+        os.unlink(version_path)
+        self.assertIsNone(extension_info.get_installed_static_version())
+
     def _check_extension_info(self, extension_info, app_name, package_name,
                               extension_id, metadata):
         htdocs_path = os.path.join(settings.MEDIA_ROOT, 'ext', package_name)
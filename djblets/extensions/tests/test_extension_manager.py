@@ -19,6 +19,7 @@ from pipeline.conf import settings as pipeline_settings
 from djblets.extensions.errors import EnablingExtensionError
 from djblets.extensions.extension import Extension
 from djblets.extensions.hooks import URLHook
+from djblets.extensions.middleware import ExtensionsMiddleware
 from djblets.extensions.manager import (ExtensionManager,
                                         get_extension_managers,
                                         logger as manager_logger)
@@ -721,6 +722,104 @@ class ExtensionManagerTests(kgb.SpyAgency, ExtensionTestCaseMixin, TestCase):
         self.assertEqual(js_bundle['output_filename'],
                          'ext/%s/js/default.min.js' % extension.id)
 
+    def test_enable_extension_with_bad_middleware(self):
+        """Testing ExtensionManager.enable_extension with middleware that
+        can't be imported
+        """
+        class MyTestExtensionWithBadMiddleware(Extension):
+            middleware = ['does.not.exist.Middleware']
+
+        extension_mgr = self.extension_mgr
+
+        self.setup_extension(MyTestExtensionWithBadMiddleware, enable=False)
+        registration = MyTestExtensionWithBadMiddleware.registration
+        registration.enabled = False
+        registration.save()
+
+        with self.assertRaises(EnablingExtensionError) as ctx:
+            extension_mgr.enable_extension(
+                MyTestExtensionWithBadMiddleware.id)
+
+        self.assertIsNotNone(ctx.exception.load_error)
+        self.assertIn(MyTestExtensionWithBadMiddleware.id,
+                      extension_mgr._load_errors)
+
+        registration.refresh_from_db()
+        self.assertFalse(registration.enabled)
+        self.assertEqual(extension_mgr.get_enabled_extensions(), [])
+        self.assertIsNone(
+            getattr(MyTestExtensionWithBadMiddleware, 'instance', None))
+
+        # Recalculating middleware should not be affected by the broken
+        # extension.
+        extension_mgr._recalculate_middleware()
+        self.assertEqual(extension_mgr.middleware_classes, [])
+
+    def test_enable_extension_with_hooks_and_bad_middleware(self):
+        """Testing ExtensionManager.enable_extension with hooks and middleware
+        that can't be imported does not register hooks
+        """
+        class MyTestExtensionWithHooksAndBadMiddleware(Extension):
+            middleware = ['does.not.exist.Middleware']
+
+            def initialize(self):
+                URLHook(self, ())
+
+        extension_mgr = self.extension_mgr
+        ext_class = MyTestExtensionWithHooksAndBadMiddleware
+
+        self.setup_extension(ext_class, enable=False)
+        registration = ext_class.registration
+        registration.enabled = False
+        registration.save()
+
+        with self.assertRaises(EnablingExtensionError):
+            extension_mgr.enable_extension(ext_class.id)
+
+        registration.refresh_from_db()
+        self.assertFalse(registration.enabled)
+        self.assertEqual(extension_mgr.get_enabled_extensions(), [])
+        self.assertEqual(len(URLHook.hooks), 0)
+
+    def test_enable_extension_after_bad_middleware_fixed(self):
+        """Testing ExtensionManager.enable_extension after fixing middleware
+        that couldn't be imported
+        """
+        class MyTestExtensionWithBadMiddleware(Extension):
+            middleware = ['does.not.exist.Middleware']
+
+        extension_mgr = self.extension_mgr
+
+        self.setup_extension(MyTestExtensionWithBadMiddleware, enable=False)
+        registration = MyTestExtensionWithBadMiddleware.registration
+        registration.enabled = False
+        registration.save()
+
+        with self.assertRaises(EnablingExtensionError):
+            extension_mgr.enable_extension(
+                MyTestExtensionWithBadMiddleware.id)
+
+        # Nothing should have been cached for the class.
+        self.assertIsNone(
+            MyTestExtensionWithBadMiddleware._resolved_middleware)
+
+        MyTestExtensionWithBadMiddleware.middleware = [
+            'djblets.extensions.middleware.ExtensionsMiddleware',
+        ]
+
+        extension = extension_mgr.enable_extension(
+            MyTestExtensionWithBadMiddleware.id)
+        self.assertIsNotNone(extension)
+
+        self.assertEqual(
+            MyTestExtensionWithBadMiddleware._resolved_middleware,
+            (ExtensionsMiddleware,))
+        self.assertEqual(extension_mgr.middleware_classes,
+                         [ExtensionsMiddleware])
+        self.assertEqual(extension_mgr.get_enabled_extensions(), [extension])
+
+        extension_mgr.disable_extension(MyTestExtensionWithBadMiddleware.id)
+
     def test_enable_extension_registers_context_processors(self):
         """Testing ExtensionManager.enable_extension registers template
         context processors
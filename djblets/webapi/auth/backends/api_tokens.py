@@ -121,7 +121,7 @@ class TokenAuthBackendMixin(object):
             If the token is valid to use for authentication this will return
             ``None``.
         """
-        q = self.api_token_model.objects.filter(token=token)
+        q = self.api_token_model.objects.for_auth().filter(token=token)
         log_extra = {
             'request': request,
         }
@@ -1,11 +1,23 @@
 """Error classes and codes for WebAPI."""
 
+from types import MappingProxyType
+
+
+#: The default headers for errors, shared between all instances.
+_EMPTY_HEADERS = MappingProxyType({})
+
 
 class WebAPIError(object):
     """
     An API error, containing an error code and human readable message.
     """
-    def __init__(self, code, msg, http_status=400, headers={}):
+
+    __slots__ = ('code', 'msg', 'http_status', 'headers')
+
+    def __init__(self, code, msg, http_status=400, headers=None):
+        if headers is None:
+            headers = _EMPTY_HEADERS
+
         self.code = code
         self.msg = msg
         self.http_status = http_status
@@ -15,9 +27,35 @@ class WebAPIError(object):
         return '<API Error %d, HTTP %d: %s>' % (self.code, self.http_status,
                                                 self.msg)
 
+    def __reduce__(self):
+        """Return state used to pickle or copy the error.
+
+        The shared default headers can't be pickled or copied, so errors
+        without custom headers are rebuilt with the default headers.
+
+        Version Added:
+            4.0
+
+        Returns:
+            tuple:
+            The callable and arguments used to reconstruct the error.
+        """
+        headers = self.headers
+
+        if headers is _EMPTY_HEADERS:
+            headers = None
+
+        return (type(self), (self.code, self.msg, self.http_status, headers))
+
     def with_overrides(self, msg=None, headers=None):
-        """Overrides the default message and/or headers for an error."""
+        """Overrides the default message and/or headers for an error.
+
+        If nothing is being overridden, this error will be returned as-is.
+        """
         if headers is None:
+            if not msg:
+                return self
+
             headers = self.headers
 
         return WebAPIError(self.code, msg or self.msg, self.http_status,
@@ -31,29 +69,69 @@ class WebAPIError(object):
         Example:
         return ENABLE_EXTENSION_FAILED.with_message('some error message')
         """
-        return self.with_overrides(msg)
+        if not msg:
+            return self
+
+        return WebAPIError(self.code, msg, self.http_status, self.headers)
 
 
 class WebAPITokenGenerationError(Exception):
     """An error generating a Web API token."""
 
 
+#: Computed authentication header state, keyed by auth backend classes.
+_auth_headers_cache = {}
+
+
 def _get_auth_headers(request):
+    """Return authentication headers for an error response.
+
+    The ``WWW-Authenticate`` header is only computed once for each set of
+    registered auth backends. Only backends that override
+    :py:meth:`~djblets.webapi.auth.backends.base.WebAPIAuthBackend
+    .get_auth_headers` will be consulted on each call.
+
+    Args:
+        request (django.http.HttpRequest):
+            The HTTP request from the client.
+
+    Returns:
+        dict:
+        The authentication headers for the response.
+    """
     from djblets.webapi.auth.backends import get_auth_backends
+    from djblets.webapi.auth.backends.base import WebAPIAuthBackend
 
-    headers = {}
-    www_auth_schemes = []
+    auth_backend_classes = tuple(get_auth_backends())
+
+    try:
+        www_auth_header, header_backend_classes = \
+            _auth_headers_cache[auth_backend_classes]
+    except KeyError:
+        www_auth_schemes = []
+        header_backend_classes = []
+
+        for auth_backend_cls in auth_backend_classes:
+            auth_backend = auth_backend_cls()
+
+            if auth_backend.www_auth_scheme:
+                www_auth_schemes.append(auth_backend.www_auth_scheme)
 
-    for auth_backend_cls in get_auth_backends():
-        auth_backend = auth_backend_cls()
+            if (auth_backend_cls.get_auth_headers is not
+                WebAPIAuthBackend.get_auth_headers):
+                header_backend_classes.append(auth_backend_cls)
 
-        if auth_backend.www_auth_scheme:
-            www_auth_schemes.append(auth_backend.www_auth_scheme)
+        www_auth_header = ', '.join(www_auth_schemes)
+        _auth_headers_cache[auth_backend_classes] = \
+            (www_auth_header, header_backend_classes)
 
-        headers.update(auth_backend.get_auth_headers(request))
+    headers = {}
+
+    for auth_backend_cls in header_backend_classes:
+        headers.update(auth_backend_cls().get_auth_headers(request))
 
-    if www_auth_schemes:
-        headers['WWW-Authenticate'] = ', '.join(www_auth_schemes)
+    if www_auth_header:
+        headers['WWW-Authenticate'] = www_auth_header
 
     return headers
 
@@ -149,3 +227,31 @@ RATE_LIMIT_EXCEEDED = WebAPIError(
     'API rate limit has been exceeded.',
     http_status=429,  # 429 Too Many Requests
 )
+
+
+#: A mapping of error codes to the standard errors.
+#:
+#: Version Added:
+#:     4.0
+WEBAPI_ERRORS_BY_CODE = {
+    error.code: error
+    for error in (
+        NO_ERROR,
+        SERVICE_NOT_CONFIGURED,
+        DOES_NOT_EXIST,
+        PERMISSION_DENIED,
+        INVALID_ATTRIBUTE,
+        NOT_LOGGED_IN,
+        LOGIN_FAILED,
+        INVALID_FORM_DATA,
+        MISSING_ATTRIBUTE,
+        ENABLE_EXTENSION_FAILED,
+        DISABLE_EXTENSION_FAILED,
+        EXTENSION_INSTALLED,
+        INSTALL_EXTENSION_FAILED,
+        DUPLICATE_ITEM,
+        OAUTH_MISSING_SCOPE_ERROR,
+        OAUTH_ACCESS_DENIED_ERROR,
+        RATE_LIMIT_EXCEEDED,
+    )
+}
@@ -13,7 +13,8 @@ from djblets.secrets.token_generators import token_generator_registry
 from djblets.secrets.token_generators.legacy_sha1 import \
     LegacySHA1TokenGenerator
 from djblets.webapi.errors import WebAPITokenGenerationError
-from djblets.webapi.signals import webapi_token_created
+from djblets.webapi.signals import (webapi_token_created,
+                                    webapi_tokens_updated)
 
 
 logger = logging.getLogger(__name__)
@@ -186,6 +187,100 @@ class WebAPITokenManager(Manager):
         raise WebAPITokenGenerationError(
             _('Could not create a unique API token. Please try again.'))
 
+    def bulk_update_and_notify(self, tokens, fields):
+        """Update several tokens at once and notify listeners.
+
+        This saves the given fields on all tokens in as few queries as
+        possible, and emits the
+        :py:data:`~djblets.webapi.signals.webapi_tokens_updated` signal once
+        for the whole batch. The per-token
+        :py:data:`~djblets.webapi.signals.webapi_token_updated` signal is
+        not emitted.
+
+        The ``last_updated`` timestamp of each token will be updated as well.
+
+        Version Added:
+            4.0
+
+        Args:
+            tokens (list of djblets.webapi.models.BaseWebAPIToken):
+                The tokens to update.
+
+            fields (list of str):
+                The names of the fields to save on each token.
+        """
+        tokens = list(tokens)
+
+        if not tokens:
+            return
+
+        now = timezone.now()
+
+        for token in tokens:
+            token.last_updated = now
+
+        fields = set(fields) | {'last_updated'}
+        self.bulk_update(tokens, fields)
+
+        for token in tokens:
+            token._record_loaded_field_values(fields)
+
+        webapi_tokens_updated.send(instances=tokens, sender=self.model)
+
+    def with_user(self):
+        """Return a queryset for tokens that also fetches their users.
+
+        This should be used when listing tokens that will be displayed, to
+        avoid a query for each token's user.
+
+        Version Added:
+            4.0
+
+        Returns:
+            django.db.models.query.QuerySet:
+            The queryset for the tokens.
+        """
+        return self.get_queryset().select_related('user')
+
+    def filter_expired(self):
+        """Return a queryset for all expired tokens.
+
+        This matches the same tokens that would return ``True`` for
+        :py:meth:`BaseWebAPIToken.is_expired()
+        <djblets.webapi.models.BaseWebAPIToken.is_expired>`, and should be
+        used instead of checking each token individually.
+
+        Version Added:
+            4.0
+
+        Returns:
+            django.db.models.query.QuerySet:
+            The queryset for the expired tokens.
+        """
+        return self.filter(expires__lte=timezone.now())
+
+    def for_auth(self):
+        """Return a queryset for looking up tokens during authentication.
+
+        This only loads the fields needed to authenticate with and validate
+        a token, along with the token's user. The ``policy`` and
+        ``extra_data`` fields are deferred. Accessing them on a token from
+        this queryset will fetch them in a separate query.
+
+        Version Added:
+            4.0
+
+        Returns:
+            django.db.models.query.QuerySet:
+            The queryset for the tokens.
+        """
+        return (
+            self.get_queryset()
+            .only('user', 'token', 'valid', 'invalid_date', 'invalid_reason',
+                  'expires', 'last_used')
+            .select_related('user')
+        )
+
     def invalidate_tokens(self,
                           users=None,
                           extra_query=None,
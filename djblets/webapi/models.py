@@ -1,3 +1,5 @@
+from weakref import WeakKeyDictionary
+
 from django.contrib.auth.models import User
 from django.core.exceptions import ValidationError
 from django.db import models
@@ -9,6 +11,63 @@ from djblets.webapi.managers import WebAPITokenManager
 from djblets.webapi.signals import webapi_token_updated
 
 
+_MISSING = object()
+
+_ERR_NOT_OBJECT = _('The policy must be a JSON object.')
+_ERR_NO_RESOURCES = _('The policy is missing a "resources" section.')
+_ERR_RESOURCES_NOT_OBJECT = _(
+    'The policy\'s "resources" section must be a JSON object.')
+_ERR_RESOURCES_EMPTY = _(
+    'The policy\'s "resources" section must not be empty.')
+_ERR_TOO_MANY_RESOURCES = _(
+    'The policy\'s "resources" section must not contain more than %d '
+    'resources.')
+_ERR_INVALID_POLICY_ID = _('"%s" is not a valid resource policy ID.')
+_ERR_TOO_MANY_SECTIONS = _(
+    'The "resources.%s" section must not contain more than %d sections.')
+_ERR_SECTION_NAME_NOT_STRING = _('%s must be a string in "resources.%s"')
+_ERR_SECTION_NOT_OBJECT = _('The "%s" section must be a JSON object.')
+_ERR_SECTION_NO_RULES = _(
+    'The "%s" section must have "allow" and/or "block" rules.')
+_ERR_ALLOW_NOT_LIST = _('The "%s" section\'s "allow" rule must be a list.')
+_ERR_BLOCK_NOT_LIST = _('The "%s" section\'s "block" rule must be a list.')
+
+
+def _is_obj(value):
+    """Return whether a decoded JSON value is an object.
+
+    Policies are decoded from JSON, so objects are always plain
+    :py:class:`dict` instances. Subclasses such as
+    :py:class:`~collections.OrderedDict` will not match.
+
+    Args:
+        value (object):
+            The value to check.
+
+    Returns:
+        bool:
+        Whether the value is a JSON object.
+    """
+    return value.__class__ is dict
+
+
+def _is_arr(value):
+    """Return whether a decoded JSON value is an array.
+
+    Policies are decoded from JSON, so arrays are always plain
+    :py:class:`list` instances. Subclasses will not match.
+
+    Args:
+        value (object):
+            The value to check.
+
+    Returns:
+        bool:
+        Whether the value is a JSON array.
+    """
+    return value.__class__ is list
+
+
 class BaseWebAPIToken(models.Model):
     """Base class for an access token used for authenticating with the API.
 
@@ -18,6 +77,17 @@ class BaseWebAPIToken(models.Model):
 
     Tokens can store policy information, which will later be used for
     restricting access to the API.
+
+    Displaying a token will fetch its user. When listing tokens, use
+    :py:meth:`WebAPITokenManager.with_user()
+    <djblets.webapi.managers.WebAPITokenManager.with_user>` to fetch the
+    users along with the tokens.
+
+    Version Changed:
+        4.0:
+        Added indexes for looking up tokens by user and validity, and by
+        expiration date. Subclasses will need a database migration to add
+        these indexes.
     """
 
     user = models.ForeignKey(
@@ -66,15 +136,55 @@ class BaseWebAPIToken(models.Model):
     note = models.TextField(
         blank=True,
         help_text=_('A message describing the token.'))
+    #: The policy document describing what this token can access.
+    #:
+    #: This is deferred when loading tokens through
+    #: :py:meth:`WebAPITokenManager.for_auth()
+    #: <djblets.webapi.managers.WebAPITokenManager.for_auth>`. Accessing it
+    #: on those tokens will fetch it in a separate query.
     policy = JSONField(
         null=True,
         help_text=_('The policy document describing what this token can '
                     'access in the API. If empty, this provides full access.'))
 
+    #: Extra data stored on the token.
+    #:
+    #: This is deferred when loading tokens through
+    #: :py:meth:`WebAPITokenManager.for_auth()
+    #: <djblets.webapi.managers.WebAPITokenManager.for_auth>`. Accessing it
+    #: on those tokens will fetch it in a separate query.
     extra_data = JSONField(null=True)
 
     objects = WebAPITokenManager()
 
+    #: The maximum number of resources allowed in a policy.
+    #:
+    #: This bounds the work done when validating a policy.
+    #:
+    #: Version Added:
+    #:     4.0
+    max_policy_resources = 256
+
+    #: The maximum number of sections allowed for a resource in a policy.
+    #:
+    #: This bounds the work done when validating a policy.
+    #:
+    #: Version Added:
+    #:     4.0
+    max_policy_resource_sections = 64
+
+    #: The cached string representation of the token.
+    #:
+    #: This is a tuple of the user ID and the string, so that it's
+    #: regenerated if the token's user changes.
+    _cached_str = None
+
+    #: A cache of valid policy IDs, keyed by root resource.
+    #:
+    #: Version Added:
+    #:     4.0
+    _valid_policy_ids_cache = WeakKeyDictionary()
+
     def is_accessible_by(self, user):
         return user.is_superuser or self.user == user
 
@@ -94,11 +204,75 @@ class BaseWebAPIToken(models.Model):
             bool:
             Whether the token is expired. This will be ``False`` if there
             is no expiration date set.
+
+        See Also:
+            :py:meth:`WebAPITokenManager.filter_expired()
+            <djblets.webapi.managers.WebAPITokenManager.filter_expired>`:
+            Used to look up expired tokens in the database.
         """
-        return self.expires is not None and timezone.now() >= self.expires
+        expires = self.expires
+
+        return expires is not None and timezone.now() >= expires
 
     def __str__(self):
-        return 'Web API token for %s' % self.user
+        user_id = self.user_id
+        cached_str = self._cached_str
+
+        if cached_str is None or cached_str[0] != user_id:
+            cached_str = (user_id, 'Web API token for %s' % self.user)
+            self._cached_str = cached_str
+
+        return cached_str[1]
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """Return a token instance loaded from the database.
+
+        This will record the loaded field values, so that :py:meth:`save`
+        can determine which fields have changed.
+
+        Version Added:
+            4.0
+
+        Args:
+            db (unicode):
+                The alias of the database the token was loaded from.
+
+            field_names (list of unicode):
+                The attribute names of the loaded fields.
+
+            values (list):
+                The loaded values for each field in ``field_names``.
+
+        Returns:
+            BaseWebAPIToken:
+            The token instance.
+        """
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_field_values = dict(zip(field_names, values))
+
+        return instance
+
+    def refresh_from_db(self, using=None, fields=None):
+        """Reload field values from the database.
+
+        This will update the recorded field values for the refreshed fields,
+        so that :py:meth:`save` compares against what's in the database.
+
+        Version Added:
+            4.0
+
+        Args:
+            using (unicode, optional):
+                The alias of the database to load from.
+
+            fields (list of unicode, optional):
+                The names of the fields to reload. If not provided, all
+                non-deferred fields will be reloaded.
+        """
+        super().refresh_from_db(using=using, fields=fields)
+
+        self._record_loaded_field_values(fields)
 
     def save(self, *args, **kwargs):
         """Save the token.
@@ -107,6 +281,13 @@ class BaseWebAPIToken(models.Model):
         :py:data:`~djblets.webapi.signals.webapi_token_updated` signal will be
         emitted.
 
+        Version Changed:
+            4.0:
+            If the token was loaded from the database and is being saved
+            back to the same database, only the fields that have changed
+            will be saved. If no fields have changed, nothing will be written
+            and the signal will not be emitted.
+
         Args:
             *args (tuple):
                 Positional arguments to pass to the superclass.
@@ -115,12 +296,105 @@ class BaseWebAPIToken(models.Model):
                 Keyword arguments to pass to the superclass.
         """
         is_new = self.pk is None
+        loaded_field_values = getattr(self, '_loaded_field_values', None)
+
+        if (not is_new and
+            not args and
+            loaded_field_values is not None and
+            'update_fields' not in kwargs and
+            not kwargs.get('force_insert') and
+            kwargs.get('using') in (None, self._state.db)):
+            changed_fields = self._get_changed_fields(loaded_field_values)
+
+            if not changed_fields:
+                # Nothing has changed since the token was loaded, so there's
+                # nothing to write.
+                return
+
+            # The modification timestamp must always be updated along with
+            # the changed fields.
+            changed_fields.add('last_updated')
+            kwargs['update_fields'] = changed_fields
 
         super().save(*args, **kwargs)
 
+        # Only the saved fields need to be recorded. This avoids
+        # re-serializing JSON fields that weren't written.
+        self._record_loaded_field_values(kwargs.get('update_fields'))
+
         if not is_new:
             webapi_token_updated.send(instance=self, sender=type(self))
 
+    def _record_loaded_field_values(self, field_names=None):
+        """Record the current values of fields as matching the database.
+
+        This is called after fields have been saved to or loaded from the
+        database, so that :py:meth:`save` only writes fields that have changed
+        since. It does nothing if the token wasn't loaded from the database.
+
+        Version Added:
+            4.0
+
+        Args:
+            field_names (list of str, optional):
+                The names or attribute names of the fields to record. If not
+                provided, all non-deferred fields will be recorded.
+        """
+        loaded_field_values = getattr(self, '_loaded_field_values', None)
+
+        if loaded_field_values is None:
+            return
+
+        if field_names is not None:
+            field_names = set(field_names)
+
+        instance_dict = self.__dict__
+
+        loaded_field_values.update(
+            (field.attname,
+             field.get_prep_value(getattr(self, field.attname)))
+            for field in self._meta.concrete_fields
+            if (field.attname in instance_dict and
+                (field_names is None or
+                 field.attname in field_names or
+                 field.name in field_names))
+        )
+
+    def _get_changed_fields(self, loaded_field_values):
+        """Return the names of fields changed since the token was loaded.
+
+        Fields are compared using their prepared database values, so that
+        JSON data is compared in serialized form.
+
+        Args:
+            loaded_field_values (dict):
+                The field values loaded from the database, keyed by attribute
+                name.
+
+        Returns:
+            set of unicode:
+            The names of the changed fields.
+        """
+        instance_dict = self.__dict__
+        changed_fields = set()
+
+        for field in self._meta.concrete_fields:
+            if field.primary_key:
+                continue
+
+            attname = field.attname
+
+            if attname not in loaded_field_values:
+                # This field was deferred when loading. It's only changed if
+                # it's since been set.
+                if attname in instance_dict:
+                    changed_fields.add(field.name)
+            elif (field.get_prep_value(getattr(self, attname)) !=
+                  field.get_prep_value(loaded_field_values[attname])):
+                changed_fields.add(field.name)
+
+        return changed_fields
+
     @classmethod
     def get_root_resource(cls):
         raise NotImplementedError
@@ -134,102 +408,172 @@ class BaseWebAPIToken(models.Model):
 
         If a failure is found, a ValidationError will be raised describing
         the error and where it was found.
+
+        Version Changed:
+            4.0:
+            Policies with more than :py:attr:`max_policy_resources`
+            resources, or resources with more than
+            :py:attr:`max_policy_resource_sections` sections, are now
+            rejected.
+
+            Sections within the policy must now be plain :py:class:`dict`
+            and :py:class:`list` instances, as produced by decoding JSON.
         """
+        # This is the public entry point, so any dictionary is accepted for
+        # the policy itself. Everything within it must be decoded JSON.
         if not isinstance(policy, dict):
-            raise ValidationError(_('The policy must be a JSON object.'))
+            raise ValidationError(_ERR_NOT_OBJECT)
 
         if not policy:
             # Empty policies are equivalent to allowing full access. If this
             # is empty, we can stop here.
             return
 
-        if 'resources' not in policy:
-            raise ValidationError(
-                _('The policy is missing a "resources" section.'))
+        resources_section = policy.get('resources', _MISSING)
 
-        resources_section = policy['resources']
+        if resources_section is _MISSING:
+            raise ValidationError(_ERR_NO_RESOURCES)
 
-        if not isinstance(resources_section, dict):
-            raise ValidationError(
-                _('The policy\'s "resources" section must be a JSON object.'))
+        if not _is_obj(resources_section):
+            raise ValidationError(_ERR_RESOURCES_NOT_OBJECT)
 
         if not resources_section:
-            raise ValidationError(
-                _('The policy\'s "resources" section must not be empty.'))
+            raise ValidationError(_ERR_RESOURCES_EMPTY)
+
+        if len(resources_section) > cls.max_policy_resources:
+            raise ValidationError(_ERR_TOO_MANY_RESOURCES
+                                  % cls.max_policy_resources)
 
         if '*' in resources_section:
             cls._validate_policy_section(resources_section, '*',
                                          'resources.*')
 
-        resource_policies = [
-            (section_name, section)
-            for section_name, section in resources_section.items()
-            if section_name != '*'
+        resource_policy_ids = [
+            policy_id
+            for policy_id in resources_section
+            if policy_id != '*'
         ]
 
-        if resource_policies:
-            valid_policy_ids = \
-                cls._get_valid_policy_ids(cls.get_root_resource())
+        if not resource_policy_ids:
+            # This is a wildcard-only policy. There are no resource policies
+            # to check, so we can skip looking up the valid policy IDs.
+            return
 
-            for policy_id, section in resource_policies:
-                if policy_id not in valid_policy_ids:
-                    raise ValidationError(
-                        _('"%s" is not a valid resource policy ID.')
-                        % policy_id)
+        valid_policy_ids = cls._get_cached_valid_policy_ids()
 
-                for subsection_name, subsection in section.items():
-                    if not isinstance(subsection_name, str):
-                        raise ValidationError(
-                            _('%s must be a string in "resources.%s"')
-                            % (subsection_name, policy_id))
+        for policy_id in resource_policy_ids:
+            if policy_id not in valid_policy_ids:
+                raise ValidationError(_ERR_INVALID_POLICY_ID % policy_id)
 
-                    cls._validate_policy_section(
-                        section, subsection_name,
-                        'resources.%s.%s' % (policy_id, subsection_name))
+            section = resources_section[policy_id]
+
+            if not _is_obj(section):
+                raise ValidationError(_ERR_SECTION_NOT_OBJECT
+                                      % ('resources.%s' % policy_id))
+
+            if len(section) > cls.max_policy_resource_sections:
+                raise ValidationError(
+                    _ERR_TOO_MANY_SECTIONS
+                    % (policy_id, cls.max_policy_resource_sections))
+
+            for subsection_name, subsection in section.items():
+                if not isinstance(subsection_name, str):
+                    raise ValidationError(
+                        _ERR_SECTION_NAME_NOT_STRING
+                        % (subsection_name, policy_id))
+
+                cls._validate_policy_section(
+                    section, subsection_name,
+                    'resources.%s.%s' % (policy_id, subsection_name))
 
     @classmethod
     def _validate_policy_section(cls, parent_section, section_name,
                                  full_section_name):
         section = parent_section[section_name]
 
-        if not isinstance(section, dict):
-            raise ValidationError(
-                _('The "%s" section must be a JSON object.')
-                % full_section_name)
+        if not _is_obj(section):
+            raise ValidationError(_ERR_SECTION_NOT_OBJECT % full_section_name)
 
-        if 'allow' not in section and 'block' not in section:
-            raise ValidationError(
-                _('The "%s" section must have "allow" and/or "block" '
-                  'rules.')
-                % full_section_name)
+        allow = section.get('allow', _MISSING)
+        block = section.get('block', _MISSING)
 
-        if 'allow' in section and not isinstance(section['allow'], list):
-            raise ValidationError(
-                _('The "%s" section\'s "allow" rule must be a list.')
-                % full_section_name)
+        if allow is _MISSING and block is _MISSING:
+            raise ValidationError(_ERR_SECTION_NO_RULES % full_section_name)
 
-        if 'block' in section and not isinstance(section['block'], list):
-            raise ValidationError(
-                _('The "%s" section\'s "block" rule must be a list.')
-                % full_section_name)
+        for rule, error in ((allow, _ERR_ALLOW_NOT_LIST),
+                            (block, _ERR_BLOCK_NOT_LIST)):
+            if rule is not _MISSING and not _is_arr(rule):
+                raise ValidationError(error % full_section_name)
 
     @classmethod
-    def _get_valid_policy_ids(cls, resource, result=None):
-        if result is None:
-            result = set()
+    def clear_policy_id_cache(cls, root_resource=None):
+        """Clear the cache of valid policy IDs.
+
+        This must be called if the resource tree under the root resource
+        changes, so that the valid policy IDs will be computed again on the
+        next validation.
 
-        if hasattr(resource, 'policy_id'):
-            result.add(resource.policy_id)
+        Cached policy IDs are also discarded automatically when their root
+        resource is garbage-collected.
 
-        for child_resource in resource.list_child_resources:
-            cls._get_valid_policy_ids(child_resource, result)
+        Version Added:
+            4.0
+
+        Args:
+            root_resource (djblets.webapi.resources.root.RootResource,
+                           optional):
+                The root resource whose policy IDs should be cleared. If not
+                provided, the policy IDs for all root resources will be
+                cleared.
+        """
+        if root_resource is None:
+            cls._valid_policy_ids_cache.clear()
+        else:
+            cls._valid_policy_ids_cache.pop(root_resource, None)
 
-        for child_resource in resource.item_child_resources:
-            cls._get_valid_policy_ids(child_resource, result)
+    @classmethod
+    def _get_cached_valid_policy_ids(cls):
+        """Return the valid policy IDs for the root resource.
 
-        return result
+        The policy IDs will be computed from the resource tree the first
+        time this is called for a root resource, and then cached.
+
+        Returns:
+            frozenset of unicode:
+            The valid policy IDs.
+        """
+        root_resource = cls.get_root_resource()
+
+        try:
+            return cls._valid_policy_ids_cache[root_resource]
+        except KeyError:
+            valid_policy_ids = cls._get_valid_policy_ids(root_resource)
+            cls._valid_policy_ids_cache[root_resource] = valid_policy_ids
+
+            return valid_policy_ids
+
+    @classmethod
+    def _get_valid_policy_ids(cls, resource):
+        result = set()
+        stack = [resource]
+
+        while stack:
+            resource = stack.pop()
+            policy_id = getattr(resource, 'policy_id', None)
+
+            if policy_id is not None:
+                result.add(policy_id)
+
+            stack.extend(resource.list_child_resources)
+            stack.extend(resource.item_child_resources)
+
+        return frozenset(result)
 
     class Meta:
         abstract = True
+        indexes = [
+            models.Index(fields=['user', 'valid']),
+            models.Index(fields=['expires']),
+        ]
         verbose_name = _('Web API token')
         verbose_name_plural = _('Web API tokens')
@@ -31,3 +31,17 @@ webapi_token_expired = Signal()
 #:     instance (djblets.webapi.models.WebAPIToken):
 #:         The updated instance.
 webapi_token_updated = Signal()
+
+
+#: A signal indicating multiple WebAPI tokens have been updated in bulk.
+#:
+#: This is emitted once for the whole batch, instead of emitting
+#: :py:data:`webapi_token_updated` for each token.
+#:
+#: Version Added:
+#:     4.0
+#:
+#: Args:
+#:     instances (list of djblets.webapi.models.WebAPIToken):
+#:         The updated instances.
+webapi_tokens_updated = Signal()
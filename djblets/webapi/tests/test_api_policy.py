@@ -1,3 +1,7 @@
+import gc
+
+import kgb
+
 from djblets.testing.testcases import TestCase
 from djblets.webapi.resources.base import WebAPIResource
 from djblets.webapi.resources.mixins.api_tokens import ResourceAPITokenMixin
@@ -319,8 +323,14 @@ class APIPolicyTests(TestCase):
                           % method)
 
 
-class APIPolicyValidationTests(TestCase):
+class APIPolicyValidationTests(kgb.SpyAgency, TestCase):
     """Tests API policy validation."""
+
+    def setUp(self):
+        super(APIPolicyValidationTests, self).setUp()
+
+        APIPolicyWebAPIToken.clear_policy_id_cache()
+
     def test_empty(self):
         """Testing BaseWebAPIToken.validate_policy with empty policy"""
         APIPolicyWebAPIToken.validate_policy({})
@@ -481,6 +491,26 @@ class APIPolicyValidationTests(TestCase):
                 }
             })
 
+    def test_resource_invalid_policy_ids_reported_in_order(self):
+        """Testing BaseWebAPIToken.validate_policy with multiple invalid
+        policy IDs reports the first one in the policy
+        """
+        resources = {
+            'policy%d' % i: {
+                '*': {
+                    'allow': ['*'],
+                },
+            }
+            for i in range(20)
+        }
+
+        self.assertRaisesValidationError(
+            '"policy0" is not a valid resource policy ID.',
+            APIPolicyWebAPIToken.validate_policy,
+            {
+                'resources': resources,
+            })
+
     def test_resource_global_not_object(self):
         """Testing BaseWebAPIToken.validate_policy with <resource>.* not an
         object
@@ -632,3 +662,127 @@ class APIPolicyValidationTests(TestCase):
                     }
                 }
             })
+
+    def test_resource_not_object(self):
+        """Testing BaseWebAPIToken.validate_policy with <resource> not an
+        object
+        """
+        for value in (5, None, []):
+            self.assertRaisesValidationError(
+                'The "resources.someobject" section must be a JSON object.',
+                APIPolicyWebAPIToken.validate_policy,
+                {
+                    'resources': {
+                        'someobject': value,
+                    },
+                })
+
+    def test_too_many_resources(self):
+        """Testing BaseWebAPIToken.validate_policy with too many resources"""
+        self.assertRaisesValidationError(
+            'The policy\'s "resources" section must not contain more than '
+            '256 resources.',
+            APIPolicyWebAPIToken.validate_policy,
+            {
+                'resources': {
+                    'resource%d' % i: {
+                        '*': {
+                            'allow': ['*'],
+                        },
+                    }
+                    for i in range(257)
+                },
+            })
+
+    def test_too_many_resource_sections(self):
+        """Testing BaseWebAPIToken.validate_policy with too many sections in
+        a resource
+        """
+        self.assertRaisesValidationError(
+            'The "resources.someobject" section must not contain more than '
+            '64 sections.',
+            APIPolicyWebAPIToken.validate_policy,
+            {
+                'resources': {
+                    'someobject': {
+                        str(i): {
+                            'allow': ['*'],
+                        }
+                        for i in range(65)
+                    },
+                },
+            })
+
+    def test_valid_policy_ids_cached(self):
+        """Testing BaseWebAPIToken.validate_policy caches valid policy IDs"""
+        policy = {
+            'resources': {
+                'someobject': {
+                    '*': {
+                        'allow': ['*'],
+                    },
+                },
+            },
+        }
+
+        self.spy_on(APIPolicyWebAPIToken._get_valid_policy_ids)
+
+        APIPolicyWebAPIToken.validate_policy(policy)
+        self.assertSpyCalledWith(APIPolicyWebAPIToken._get_valid_policy_ids,
+                                 root_resource)
+
+        APIPolicyWebAPIToken._get_valid_policy_ids.reset_calls()
+        APIPolicyWebAPIToken.validate_policy(policy)
+        self.assertSpyNotCalled(APIPolicyWebAPIToken._get_valid_policy_ids)
+
+        APIPolicyWebAPIToken.clear_policy_id_cache()
+        APIPolicyWebAPIToken.validate_policy(policy)
+        self.assertSpyCalledWith(APIPolicyWebAPIToken._get_valid_policy_ids,
+                                 root_resource)
+
+    def test_clear_policy_id_cache_with_root_resource(self):
+        """Testing BaseWebAPIToken.clear_policy_id_cache with a root
+        resource
+        """
+        class OtherRootResource:
+            list_child_resources = []
+            item_child_resources = []
+
+        other_root_resource = OtherRootResource()
+
+        valid_policy_ids = APIPolicyWebAPIToken._get_cached_valid_policy_ids()
+        self.assertIsInstance(valid_policy_ids, frozenset)
+        self.assertIn('someobject', valid_policy_ids)
+
+        BaseWebAPIToken._valid_policy_ids_cache[other_root_resource] = \
+            frozenset()
+
+        APIPolicyWebAPIToken.clear_policy_id_cache(root_resource)
+
+        self.assertNotIn(root_resource,
+                         BaseWebAPIToken._valid_policy_ids_cache)
+        self.assertIn(other_root_resource,
+                      BaseWebAPIToken._valid_policy_ids_cache)
+
+        # The cached entry should go away along with the root resource.
+        del other_root_resource
+        gc.collect()
+
+        self.assertEqual(len(BaseWebAPIToken._valid_policy_ids_cache), 0)
+
+    def test_global_only_skips_valid_policy_ids(self):
+        """Testing BaseWebAPIToken.validate_policy with only a '*' section
+        does not look up valid policy IDs
+        """
+        self.spy_on(APIPolicyWebAPIToken._get_cached_valid_policy_ids)
+
+        APIPolicyWebAPIToken.validate_policy({
+            'resources': {
+                '*': {
+                    'allow': ['*'],
+                },
+            },
+        })
+
+        self.assertSpyNotCalled(
+            APIPolicyWebAPIToken._get_cached_valid_policy_ids)
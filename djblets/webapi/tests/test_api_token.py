@@ -22,7 +22,7 @@ class WebAPIToken(BaseWebAPIToken):
     my_field = models.BooleanField(default=False)
 
 
-class WebAPITokenTests(TestCase):
+class WebAPITokenTests(kgb.SpyAgency, TestCase):
     """Unit tests for BaseWebAPIToken.
 
     Version Added:
@@ -72,6 +72,192 @@ class WebAPITokenTests(TestCase):
 
         self.assertFalse(webapi_token.is_expired())
 
+    def test_str(self):
+        """Testing BaseWebAPIToken.__str__"""
+        webapi_token = WebAPIToken.objects.generate_token(
+            self.user,
+            token_generator_id=self.token_generator_id,
+            token_info=self.token_info)
+
+        self.assertEqual(str(webapi_token), 'Web API token for test-user')
+
+        # Changing the user should regenerate the string.
+        webapi_token.user = User.objects.create(username='test-user-2')
+
+        self.assertEqual(str(webapi_token), 'Web API token for test-user-2')
+
+    def test_save_without_changes(self):
+        """Testing BaseWebAPIToken.save with a loaded token and no changes"""
+        webapi_token = WebAPIToken.objects.generate_token(
+            self.user,
+            token_generator_id=self.token_generator_id,
+            token_info=self.token_info,
+            extra_data={'a': 1, 'b': 2})
+        webapi_token = WebAPIToken.objects.get(pk=webapi_token.pk)
+
+        with self.assertNumQueries(0):
+            webapi_token.save()
+
+    def test_save_without_changes_with_using(self):
+        """Testing BaseWebAPIToken.save with a loaded token and no changes
+        saved to another database
+        """
+        webapi_token = WebAPIToken.objects.generate_token(
+            self.user,
+            token_generator_id=self.token_generator_id,
+            token_info=self.token_info)
+        webapi_token = WebAPIToken.objects.get(pk=webapi_token.pk)
+
+        # Only the default database is available in tests, so the save
+        # can't be performed for real.
+        self.spy_on(models.Model.save,
+                    owner=models.Model,
+                    call_original=False)
+
+        # Saving to the database the token was loaded from should still
+        # skip the write.
+        webapi_token.save(using='default')
+        self.assertSpyNotCalled(models.Model.save)
+
+        webapi_token.save(using='other-db')
+        self.assertSpyCalledWith(models.Model.save,
+                                 using='other-db',
+                                 update_fields=None)
+
+    def test_save_with_changes(self):
+        """Testing BaseWebAPIToken.save with a loaded token and changes"""
+        webapi_token = WebAPIToken.objects.generate_token(
+            self.user,
+            token_generator_id=self.token_generator_id,
+            token_info=self.token_info)
+        webapi_token = WebAPIToken.objects.get(pk=webapi_token.pk)
+        old_last_updated = webapi_token.last_updated
+
+        webapi_token.note = 'New note'
+        webapi_token.extra_data['a'] = 1
+
+        with self.assertNumQueries(1):
+            webapi_token.save()
+
+        # A second save should not write anything.
+        with self.assertNumQueries(0):
+            webapi_token.save()
+
+        webapi_token = WebAPIToken.objects.get(pk=webapi_token.pk)
+        self.assertEqual(webapi_token.note, 'New note')
+        self.assertEqual(webapi_token.extra_data, {'a': 1})
+        self.assertGreaterEqual(webapi_token.last_updated, old_last_updated)
+
+    def test_save_after_refresh_from_db(self):
+        """Testing BaseWebAPIToken.save with a loaded token after
+        refresh_from_db
+        """
+        webapi_token = WebAPIToken.objects.generate_token(
+            self.user,
+            note='A',
+            token_generator_id=self.token_generator_id,
+            token_info=self.token_info)
+        webapi_token = WebAPIToken.objects.get(pk=webapi_token.pk)
+
+        WebAPIToken.objects.filter(pk=webapi_token.pk).update(note='B')
+
+        webapi_token.refresh_from_db()
+        self.assertEqual(webapi_token.note, 'B')
+
+        webapi_token.note = 'A'
+
+        with self.assertNumQueries(1):
+            webapi_token.save()
+
+        webapi_token = WebAPIToken.objects.get(pk=webapi_token.pk)
+        self.assertEqual(webapi_token.note, 'A')
+
+    def test_save_after_refresh_from_db_with_fields(self):
+        """Testing BaseWebAPIToken.save with a loaded token after
+        refresh_from_db with specific fields
+        """
+        webapi_token = WebAPIToken.objects.generate_token(
+            self.user,
+            note='A',
+            token_generator_id=self.token_generator_id,
+            token_info=self.token_info)
+        webapi_token = WebAPIToken.objects.get(pk=webapi_token.pk)
+
+        WebAPIToken.objects.filter(pk=webapi_token.pk).update(
+            note='B',
+            extra_data='{"a": 1}')
+
+        webapi_token.refresh_from_db(fields=['note', 'extra_data'])
+        self.assertEqual(webapi_token.extra_data, {'a': 1})
+
+        # Nothing has changed since the refresh.
+        with self.assertNumQueries(0):
+            webapi_token.save()
+
+        webapi_token.note = 'A'
+        webapi_token.extra_data = {}
+
+        with self.assertNumQueries(1):
+            webapi_token.save()
+
+        webapi_token = WebAPIToken.objects.get(pk=webapi_token.pk)
+        self.assertEqual(webapi_token.note, 'A')
+        self.assertEqual(webapi_token.extra_data, {})
+
+    def test_save_after_bulk_update_and_notify(self):
+        """Testing BaseWebAPIToken.save with a loaded token after
+        WebAPITokenManager.bulk_update_and_notify
+        """
+        webapi_token = WebAPIToken.objects.generate_token(
+            self.user,
+            note='A',
+            token_generator_id=self.token_generator_id,
+            token_info=self.token_info)
+        webapi_token = WebAPIToken.objects.get(pk=webapi_token.pk)
+
+        webapi_token.note = 'B'
+        WebAPIToken.objects.bulk_update_and_notify([webapi_token], ['note'])
+
+        # Nothing has changed since the bulk update.
+        with self.assertNumQueries(0):
+            webapi_token.save()
+
+        webapi_token.note = 'A'
+
+        with self.assertNumQueries(1):
+            webapi_token.save()
+
+        webapi_token = WebAPIToken.objects.get(pk=webapi_token.pk)
+        self.assertEqual(webapi_token.note, 'A')
+
+    def test_save_with_update_fields(self):
+        """Testing BaseWebAPIToken.save with a loaded token and
+        update_fields
+        """
+        webapi_token = WebAPIToken.objects.generate_token(
+            self.user,
+            token_generator_id=self.token_generator_id,
+            token_info=self.token_info)
+        webapi_token = WebAPIToken.objects.get(pk=webapi_token.pk)
+
+        webapi_token.note = 'New note'
+
+        with self.assertNumQueries(1):
+            webapi_token.save(update_fields=('note', 'last_updated'))
+
+        # The saved fields should now be considered unchanged.
+        with self.assertNumQueries(0):
+            webapi_token.save()
+
+        webapi_token.extra_data['a'] = 1
+
+        with self.assertNumQueries(1):
+            webapi_token.save()
+
+        webapi_token = WebAPIToken.objects.get(pk=webapi_token.pk)
+        self.assertEqual(webapi_token.note, 'New note')
+        self.assertEqual(webapi_token.extra_data, {'a': 1})
+
 
 class WebAPITokenManagerTests(kgb.SpyAgency, TestCase):
     """Unit tests for WebAPITokenManager."""
@@ -133,6 +319,74 @@ class WebAPITokenManagerTests(kgb.SpyAgency, TestCase):
 
         self.assertTrue(webapi_token.my_field)
 
+    def test_with_user(self):
+        """Testing WebAPITokenManager.with_user"""
+        for i in range(2):
+            WebAPIToken.objects.generate_token(
+                self.user,
+                token_generator_id=self.token_generator_id,
+                token_info=self.token_info)
+
+        with self.assertNumQueries(1):
+            self.assertEqual(
+                [
+                    str(webapi_token)
+                    for webapi_token in WebAPIToken.objects.with_user()
+                ],
+                [
+                    'Web API token for test-user',
+                    'Web API token for test-user',
+                ])
+
+    def test_filter_expired(self):
+        """Testing WebAPITokenManager.filter_expired"""
+        now = timezone.now()
+
+        expired_token = WebAPIToken.objects.generate_token(
+            self.user,
+            expires=(now - timedelta(hours=1)),
+            token_generator_id=self.token_generator_id,
+            token_info=self.token_info)
+        WebAPIToken.objects.generate_token(
+            self.user,
+            expires=(now + timedelta(hours=1)),
+            token_generator_id=self.token_generator_id,
+            token_info=self.token_info)
+        WebAPIToken.objects.generate_token(
+            self.user,
+            token_generator_id=self.token_generator_id,
+            token_info=self.token_info)
+
+        self.assertEqual(list(WebAPIToken.objects.filter_expired()),
+                         [expired_token])
+
+    def test_for_auth(self):
+        """Testing WebAPITokenManager.for_auth"""
+        webapi_token = WebAPIToken.objects.generate_token(
+            self.user,
+            token_generator_id=self.token_generator_id,
+            token_info=self.token_info,
+            policy={'resources': {'*': {'allow': ['*']}}})
+
+        with self.assertNumQueries(1):
+            webapi_token = (
+                WebAPIToken.objects.for_auth()
+                .get(token=webapi_token.token)
+            )
+
+            self.assertEqual(webapi_token.user, self.user)
+            self.assertTrue(webapi_token.valid)
+            self.assertIsNone(webapi_token.expires)
+
+        self.assertEqual(webapi_token.get_deferred_fields(),
+                         {'policy', 'extra_data', 'token_generator_id',
+                          'time_added', 'last_updated', 'note', 'my_field'})
+
+        # Accessing a deferred field should fetch it.
+        with self.assertNumQueries(1):
+            self.assertEqual(webapi_token.policy,
+                             {'resources': {'*': {'allow': ['*']}}})
+
     def test_last_updated(self):
         """Testing WebAPITokenManager.save updates the last updated field"""
         self.spy_on(timezone.now, op=kgb.SpyOpReturn(timezone.now()))
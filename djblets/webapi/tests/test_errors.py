@@ -1,8 +1,44 @@
+import copy
+import pickle
+
+import kgb
+from django.test.client import RequestFactory
+from django.test.utils import override_settings
+
 from djblets.testing.testcases import TestCase
-from djblets.webapi.errors import WebAPIError
+from djblets.webapi.auth.backends import reset_auth_backends
+from djblets.webapi.auth.backends.base import WebAPIAuthBackend
+from djblets.webapi.auth.backends.basic import WebAPIBasicAuthBackend
+from djblets.webapi.errors import (DOES_NOT_EXIST,
+                                   NOT_LOGGED_IN,
+                                   RATE_LIMIT_EXCEEDED,
+                                   WEBAPI_ERRORS_BY_CODE,
+                                   WebAPIError,
+                                   _auth_headers_cache)
+
+
+class BasicAuthBackend(WebAPIBasicAuthBackend):
+    """A Basic auth backend whose construction can be spied on."""
+
+    def __init__(self, *args, **kwargs):
+        super(BasicAuthBackend, self).__init__(*args, **kwargs)
+
+
+class HeaderAuthBackend(WebAPIAuthBackend):
+    """An auth backend providing custom request-dependent headers."""
+
+    www_auth_scheme = 'Custom realm="Web API"'
+
+    def __init__(self, *args, **kwargs):
+        super(HeaderAuthBackend, self).__init__(*args, **kwargs)
+
+    def get_auth_headers(self, request):
+        return {
+            'X-Auth-Path': request.path,
+        }
 
 
-class WebAPIErrorTests(TestCase):
+class WebAPIErrorTests(kgb.SpyAgency, TestCase):
     """Unit tests for djblets.webapi.errors."""
 
     def test_with_message(self):
@@ -47,3 +83,159 @@ class WebAPIErrorTests(TestCase):
         self.assertEqual(new_error.http_status, orig_error.http_status)
         self.assertEqual(orig_error.msg, orig_msg)
         self.assertEqual(orig_error.headers, orig_headers)
+
+    def test_with_message_without_message(self):
+        """Testing WebAPIError.with_message without a new message"""
+        error = WebAPIError(123, 'Original message', http_status=500)
+
+        self.assertIs(error.with_message(None), error)
+
+    def test_with_overrides_without_overrides(self):
+        """Testing WebAPIError.with_overrides without any overrides"""
+        error = WebAPIError(123, 'Original message', http_status=500)
+
+        self.assertIs(error.with_overrides(), error)
+
+    def test_default_headers(self):
+        """Testing WebAPIError default headers are shared and read-only"""
+        error1 = WebAPIError(123, 'Message 1')
+        error2 = WebAPIError(456, 'Message 2')
+
+        self.assertEqual(error1.headers, {})
+        self.assertIs(error1.headers, error2.headers)
+
+        with self.assertRaises(TypeError):
+            error1.headers['foo'] = 'bar'
+
+    def test_slots(self):
+        """Testing WebAPIError does not have an instance __dict__"""
+        error = WebAPIError(123, 'Message')
+
+        self.assertFalse(hasattr(error, '__dict__'))
+
+        with self.assertRaises(AttributeError):
+            error.foo = 'bar'
+
+    def test_deepcopy(self):
+        """Testing WebAPIError with copy.deepcopy"""
+        error = copy.deepcopy(DOES_NOT_EXIST)
+
+        self.assertIsNot(error, DOES_NOT_EXIST)
+        self.assertEqual(error.code, DOES_NOT_EXIST.code)
+        self.assertEqual(error.msg, DOES_NOT_EXIST.msg)
+        self.assertEqual(error.http_status, DOES_NOT_EXIST.http_status)
+        self.assertIs(error.headers, DOES_NOT_EXIST.headers)
+
+    def test_deepcopy_with_headers(self):
+        """Testing WebAPIError with copy.deepcopy and custom headers"""
+        error = WebAPIError(123, 'Message', headers={'X-Foo': 'bar'})
+        error_copy = copy.deepcopy(error)
+
+        self.assertEqual(error_copy.headers, {'X-Foo': 'bar'})
+        self.assertIsNot(error_copy.headers, error.headers)
+
+    def test_pickle(self):
+        """Testing WebAPIError with pickle"""
+        error = pickle.loads(pickle.dumps(DOES_NOT_EXIST))
+
+        self.assertEqual(error.code, DOES_NOT_EXIST.code)
+        self.assertEqual(error.msg, DOES_NOT_EXIST.msg)
+        self.assertEqual(error.http_status, DOES_NOT_EXIST.http_status)
+        self.assertIs(error.headers, DOES_NOT_EXIST.headers)
+
+        error = pickle.loads(pickle.dumps(
+            WebAPIError(123, 'Message', 401, headers={'X-Foo': 'bar'})))
+
+        self.assertEqual(error.code, 123)
+        self.assertEqual(error.msg, 'Message')
+        self.assertEqual(error.http_status, 401)
+        self.assertEqual(error.headers, {'X-Foo': 'bar'})
+
+    def test_errors_by_code(self):
+        """Testing WEBAPI_ERRORS_BY_CODE"""
+        self.assertEqual(len(WEBAPI_ERRORS_BY_CODE), 17)
+        self.assertIs(WEBAPI_ERRORS_BY_CODE[100], DOES_NOT_EXIST)
+        self.assertIs(WEBAPI_ERRORS_BY_CODE[103], NOT_LOGGED_IN)
+        self.assertIs(WEBAPI_ERRORS_BY_CODE[114], RATE_LIMIT_EXCEEDED)
+
+    @override_settings(WEB_API_AUTH_BACKENDS=[
+        'djblets.webapi.tests.test_errors.BasicAuthBackend',
+        'djblets.webapi.tests.test_errors.HeaderAuthBackend',
+    ])
+    def test_auth_headers(self):
+        """Testing WebAPIError.headers with auth headers"""
+        reset_auth_backends()
+        self.addCleanup(reset_auth_backends)
+
+        _auth_headers_cache.clear()
+        self.addCleanup(_auth_headers_cache.clear)
+
+        self.spy_on(BasicAuthBackend.__init__, owner=BasicAuthBackend)
+        self.spy_on(HeaderAuthBackend.__init__, owner=HeaderAuthBackend)
+        self.spy_on(HeaderAuthBackend.get_auth_headers,
+                    owner=HeaderAuthBackend)
+
+        request_factory = RequestFactory()
+        request = request_factory.get('/api/a/')
+
+        self.assertEqual(
+            NOT_LOGGED_IN.headers(request),
+            {
+                'WWW-Authenticate': 'Basic realm="Web API", '
+                                    'Custom realm="Web API"',
+                'X-Auth-Path': '/api/a/',
+            })
+
+        # Computing WWW-Authenticate constructs every backend once. The
+        # backend providing its own headers is then constructed again to
+        # compute them.
+        self.assertSpyCallCount(BasicAuthBackend.__init__, 1)
+        self.assertSpyCallCount(HeaderAuthBackend.__init__, 2)
+        self.assertSpyCallCount(HeaderAuthBackend.get_auth_headers, 1)
+        self.assertSpyCalledWith(HeaderAuthBackend.get_auth_headers,
+                                 request)
+        self.assertEqual(len(_auth_headers_cache), 1)
+
+        BasicAuthBackend.__init__.reset_calls()
+        HeaderAuthBackend.__init__.reset_calls()
+        HeaderAuthBackend.get_auth_headers.reset_calls()
+
+        # Headers from the backends must still be computed per-request, but
+        # WWW-Authenticate should come from the cache.
+        request = request_factory.get('/api/b/')
+
+        self.assertEqual(
+            NOT_LOGGED_IN.headers(request),
+            {
+                'WWW-Authenticate': 'Basic realm="Web API", '
+                                    'Custom realm="Web API"',
+                'X-Auth-Path': '/api/b/',
+            })
+
+        self.assertSpyNotCalled(BasicAuthBackend.__init__)
+        self.assertSpyCallCount(HeaderAuthBackend.__init__, 1)
+        self.assertSpyCallCount(HeaderAuthBackend.get_auth_headers, 1)
+        self.assertSpyCalledWith(HeaderAuthBackend.get_auth_headers,
+                                 request)
+        self.assertEqual(len(_auth_headers_cache), 1)
+
+        # A different set of backends must compute its own header.
+        BasicAuthBackend.__init__.reset_calls()
+        HeaderAuthBackend.__init__.reset_calls()
+        HeaderAuthBackend.get_auth_headers.reset_calls()
+
+        with override_settings(WEB_API_AUTH_BACKENDS=[
+            'djblets.webapi.tests.test_errors.BasicAuthBackend',
+        ]):
+            reset_auth_backends()
+
+            self.assertEqual(
+                NOT_LOGGED_IN.headers(request),
+                {
+                    'WWW-Authenticate': 'Basic realm="Web API"',
+                })
+
+        self.assertSpyCallCount(BasicAuthBackend.__init__, 1)
+        self.assertSpyNotCalled(HeaderAuthBackend.__init__)
+        self.assertSpyNotCalled(HeaderAuthBackend.get_auth_headers)
+        self.assertEqual(len(_auth_headers_cache), 2)
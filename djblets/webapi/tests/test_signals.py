@@ -17,7 +17,8 @@ from djblets.webapi.auth.backends.api_tokens import (TokenAuthBackendMixin,
                                                      WebAPITokenAuthBackend)
 from djblets.webapi.signals import (webapi_token_created,
                                     webapi_token_expired,
-                                    webapi_token_updated)
+                                    webapi_token_updated,
+                                    webapi_tokens_updated)
 from djblets.webapi.tests.test_api_token import WebAPIToken
 
 
@@ -165,3 +166,50 @@ class WebAPITokenSignalsTests(SpyAgency, TestModelsLoaderMixin, TestCase):
         finally:
             webapi_token_created.disconnect(on_webapi_token_created)
             webapi_token_updated.disconnect(on_webapi_token_updated)
+
+    def test_webapi_tokens_updated(self):
+        """Testing WebAPIToken.objects.bulk_update_and_notify() emits
+        webapi_tokens_updated once
+        """
+        def on_webapi_token_updated(**kwargs):
+            pass
+
+        def on_webapi_tokens_updated(**kwargs):
+            pass
+
+        tokens = [
+            WebAPIToken.objects.generate_token(
+                self.user,
+                token_generator_id=self.token_generator_id,
+                token_info=self.token_info)
+            for i in range(3)
+        ]
+
+        webapi_token_updated.connect(on_webapi_token_updated)
+        webapi_tokens_updated.connect(on_webapi_tokens_updated)
+
+        try:
+            self.spy_on(on_webapi_token_updated)
+            self.spy_on(on_webapi_tokens_updated)
+
+            for token in tokens:
+                token.note = 'Updated'
+
+            with self.assertNumQueries(1):
+                WebAPIToken.objects.bulk_update_and_notify(tokens, ['note'])
+
+            self.assertFalse(on_webapi_token_updated.spy.called)
+            self.assertSpyCallCount(on_webapi_tokens_updated, 1)
+            self.assertSpyCalledWith(on_webapi_tokens_updated,
+                                     instances=tokens,
+                                     sender=WebAPIToken)
+        finally:
+            webapi_token_updated.disconnect(on_webapi_token_updated)
+            webapi_tokens_updated.disconnect(on_webapi_tokens_updated)
+
+        self.assertEqual(
+            list(WebAPIToken.objects.filter(pk__in=[
+                token.pk
+                for token in tokens
+            ]).values_list('note', flat=True)),
+            ['Updated', 'Updated', 'Updated'])
@@ -0,0 +1 @@
+Djblets.Avatars = {};
@@ -0,0 +1,3 @@
+window.Djblets = window.Djblets || {};
+
+Djblets.Config = {};
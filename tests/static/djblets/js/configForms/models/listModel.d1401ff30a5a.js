@@ -0,0 +1,4 @@
+/**
+ * Base class for a list used for config forms.
+ */
+Djblets.Config.List = Backbone.Model.extend();
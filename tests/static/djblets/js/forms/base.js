@@ -0,0 +1,2 @@
+window.Djblets = window.Djblets || {};
+Djblets.Forms = {};
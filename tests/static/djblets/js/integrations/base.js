@@ -0,0 +1,3 @@
+if (!window.Djblets) {
+    window.Djblets = {};
+}